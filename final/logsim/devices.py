@@ -196,7 +196,7 @@ class Devices:
                 return signal_name
             elif port_id in device.outputs or port_id in device.inputs:
                 port_name = self.names.get_name_string(port_id)
-                signal_name = ".".join([device_name, port_name])
+                signal_name = f"{device_name}.{port_name}"
                 return signal_name
             else:
                 return None
@@ -252,7 +252,7 @@ class Devices:
         self.add_output(device_id, output_id=None)
 
         for input_number in range(1, no_of_inputs + 1):
-            input_name = "".join(["I", str(input_number)])
+            input_name = f"I{input_number}"
             [input_id] = self.names.lookup([input_name])
             self.add_input(device_id, input_id)
 
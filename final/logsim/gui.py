@@ -35,15 +35,10 @@ class Gui(wx.Frame):
 
     Public methods
     --------------
-    on_menu(self, event): Event handler for the file menu.
-
     check_errors(self, filename, parser): Handles the error checking when a file is uploaded.
 
     update_parser(self, parser): Updates the parser object.
 
-    on_upload_button(self, event): Event handler for when user clicks the upload button to upload
-    a specification file (.txt file).
-
     disable_monitor_buttons(self): Disable buttons controlling monitor
 
     disable_simulation_buttons(self): Disable buttons controlling simulation.
@@ -95,6 +90,31 @@ class Gui(wx.Frame):
         self.theme = "light"
         self.set_gui_layout()
 
+        # Theme colours of the fixed widgets:
+        # [(widget, light background, light foreground, dark background, dark foreground)]
+        self.themed_widgets = [
+            (self, Color.light_background_color, None, Color.dark_background_color, None),
+            (self.canvas_buttons.canvas_buttons_panel,
+             Color.light_background_color, None, Color.dark_background_color, None),
+            (self.cycle_selector.cycles_text, None, Color.light_text_color, None, Color.dark_text_color),
+            (self.cycle_selector.cycles_spin, Color.light_background_secondary, Color.light_text_color,
+             Color.dark_background_secondary, Color.dark_text_color),
+            (self.monitors_list.monitors_text, None, Color.light_text_color, None, Color.dark_text_color),
+            (self.monitors_list.monitors_scrolled, Color.light_background_secondary, Color.light_background_secondary,
+             Color.dark_background_secondary, Color.dark_background_secondary),
+            (self.switch.switches_text, None, Color.light_text_color, None, Color.dark_text_color),
+            (self.switch.switches_scrolled, Color.light_background_secondary, Color.light_background_secondary,
+             Color.dark_background_secondary, Color.dark_background_secondary)
+        ]
+        self.themed_widgets += [(button, Color.light_button_color, Color.light_text_color,
+                                 Color.dark_button_color, Color.dark_text_color)
+                                for button in [self.canvas_buttons.screenshot_button,
+                                               self.canvas_buttons.origin_button,
+                                               self.canvas_buttons.grid_button,
+                                               self.canvas_buttons.toggle_mode_button,
+                                               self.add_monitor_button,
+                                               self.remove_monitor_button]]
+
         # Checking the file supplied using <filepath>
         self.check_errors(path, self.parser)
 
@@ -190,8 +210,10 @@ class Gui(wx.Frame):
 
     def reset_gui_display(self) -> None:
         """Reset gui display when new file is uploaded."""
-        self.monitors_list.monitors_scrolled_sizer.Clear(True)
+        self.monitors_list.clear_monitors_list()
         self.switch.switches_scrolled_sizer.Clear(True)
+        self.switch.switch_labels = []
+        self.switch.switch_toggles = []
 
     def update_add_remove_button_states(self) -> None:
         """Updates the enabled/disabled state of the add and remove buttons."""
@@ -237,84 +259,30 @@ class Gui(wx.Frame):
 
     def toggle_theme(self, event) -> None:
         """Handle the event when the user presses the toggle switch menu item to switch between colour themes."""
-        if self.theme == "light":
-            self.canvas.update_theme(self.theme)
-            self.SetBackgroundColour(Color.dark_background_color)
-            self.canvas_buttons.canvas_buttons_panel.SetBackgroundColour(Color.dark_background_color)
-            self.canvas_buttons.screenshot_button.SetBackgroundColour(Color.dark_button_color)
-            self.canvas_buttons.screenshot_button.SetForegroundColour(Color.dark_text_color)
-            self.canvas_buttons.origin_button.SetBackgroundColour(Color.dark_button_color)
-            self.canvas_buttons.origin_button.SetForegroundColour(Color.dark_text_color)
-            self.canvas_buttons.grid_button.SetBackgroundColour(Color.dark_button_color)
-            self.canvas_buttons.grid_button.SetForegroundColour(Color.dark_text_color)
-            self.canvas_buttons.toggle_mode_button.SetBackgroundColour(Color.dark_button_color)
-            self.canvas_buttons.toggle_mode_button.SetForegroundColour(Color.dark_text_color)
-            self.cycle_selector.cycles_text.SetForegroundColour(Color.dark_text_color)
-            self.cycle_selector.cycles_spin.SetBackgroundColour(Color.dark_background_secondary)
-            self.cycle_selector.cycles_spin.SetForegroundColour(Color.dark_text_color)
-            self.monitors_list.monitors_text.SetForegroundColour(Color.dark_text_color)
-            self.monitors_list.monitors_scrolled.SetForegroundColour(Color.dark_background_secondary)
-            self.monitors_list.monitors_scrolled.SetBackgroundColour(Color.dark_background_secondary)
-            self.add_monitor_button.SetBackgroundColour(Color.dark_button_color)
-            self.add_monitor_button.SetForegroundColour(Color.dark_text_color)
-            self.remove_monitor_button.SetBackgroundColour(Color.dark_button_color)
-            self.remove_monitor_button.SetForegroundColour(Color.dark_text_color)
-            self.switch.switches_text.SetForegroundColour(Color.dark_text_color)
-            self.switch.switches_scrolled.SetBackgroundColour(Color.dark_background_secondary)
-            self.switch.switches_scrolled.SetForegroundColour(Color.dark_background_secondary)
-
-            for child in self.monitors_list.monitors_scrolled.GetChildren():
-                if isinstance(child, wx.StaticText):
-                    child.SetForegroundColour(Color.dark_text_color)
+        self.canvas.update_theme(self.theme)
+
+        is_dark = self.theme == "light"
+        self.theme = "dark" if is_dark else "light"  # update theme
+        index = 2 if is_dark else 0  # position of the (background, foreground) pair in each entry
+
+        # The labels and toggle buttons in the scrolled lists change with the circuit
+        themed_widgets = (self.themed_widgets +
+                          [(label, None, Color.light_text_color, None, Color.dark_text_color)
+                           for label in self.monitors_list.monitor_labels + self.switch.switch_labels] +
+                          [(toggle, Color.light_button_color, Color.light_text_color,
+                            Color.dark_button_color, Color.dark_text_color)
+                           for toggle in self.switch.switch_toggles])
+
+        # Apply all colours with repaints suspended until every widget is updated
+        self.Freeze()
+        try:
+            for widget, *colors in themed_widgets:
+                if colors[index] is not None:
+                    widget.SetBackgroundColour(colors[index])
+                if colors[index + 1] is not None:
+                    widget.SetForegroundColour(colors[index + 1])
             self.monitors_list.monitors_scrolled.Layout()
-
-            for child in self.switch.switches_scrolled.GetChildren():
-                if isinstance(child, wx.StaticText):
-                    child.SetForegroundColour(Color.dark_text_color)
-                elif isinstance(child, wx.ToggleButton):
-                    child.SetBackgroundColour(Color.dark_button_color)
-                    child.SetForegroundColour(Color.dark_text_color)
-
-            self.theme = "dark"  # update theme
-
-        elif self.theme == "dark":
-            self.canvas.update_theme(self.theme)
-            self.SetBackgroundColour(Color.light_background_color)
-            self.canvas_buttons.canvas_buttons_panel.SetBackgroundColour(Color.light_background_color)
-            self.canvas_buttons.screenshot_button.SetBackgroundColour(Color.light_button_color)
-            self.canvas_buttons.screenshot_button.SetForegroundColour(Color.light_text_color)
-            self.canvas_buttons.origin_button.SetBackgroundColour(Color.light_button_color)
-            self.canvas_buttons.origin_button.SetForegroundColour(Color.light_text_color)
-            self.canvas_buttons.grid_button.SetBackgroundColour(Color.light_button_color)
-            self.canvas_buttons.grid_button.SetForegroundColour(Color.light_text_color)
-            self.canvas_buttons.toggle_mode_button.SetBackgroundColour(Color.light_button_color)
-            self.canvas_buttons.toggle_mode_button.SetForegroundColour(Color.light_text_color)
-            self.cycle_selector.cycles_text.SetForegroundColour(Color.light_text_color)
-            self.cycle_selector.cycles_spin.SetBackgroundColour(Color.light_background_secondary)
-            self.cycle_selector.cycles_spin.SetForegroundColour(Color.light_text_color)
-            self.monitors_list.monitors_text.SetForegroundColour(Color.light_text_color)
-            self.monitors_list.monitors_scrolled.SetForegroundColour(Color.light_background_secondary)
-            self.monitors_list.monitors_scrolled.SetBackgroundColour(Color.light_background_secondary)
-            self.add_monitor_button.SetBackgroundColour(Color.light_button_color)
-            self.add_monitor_button.SetForegroundColour(Color.light_text_color)
-            self.remove_monitor_button.SetBackgroundColour(Color.light_button_color)
-            self.remove_monitor_button.SetForegroundColour(Color.light_text_color)
-            self.switch.switches_text.SetForegroundColour(Color.light_text_color)
-            self.switch.switches_scrolled.SetBackgroundColour(Color.light_background_secondary)
-            self.switch.switches_scrolled.SetForegroundColour(Color.light_background_secondary)
-
-            for child in self.monitors_list.monitors_scrolled.GetChildren():
-                if isinstance(child, wx.StaticText):
-                    child.SetForegroundColour(Color.light_text_color)
-            self.monitors_list.monitors_scrolled.Layout()
-
-            for child in self.switch.switches_scrolled.GetChildren():
-                if isinstance(child, wx.StaticText):
-                    child.SetForegroundColour(Color.light_text_color)
-                elif isinstance(child, wx.ToggleButton):
-                    child.SetBackgroundColour(Color.light_button_color)
-                    child.SetForegroundColour(Color.light_text_color)
-
-            self.theme = "light"  # update theme
+        finally:
+            self.Thaw()
 
         self.Refresh()
@@ -114,6 +114,7 @@ class MonitorAddButton(wx.Button):
         device_port = None
         if dialog.ShowModal() == wx.ID_OK:
             device_name = dialog.get_selected_item()
+        dialog.Destroy()
         if device_name:
             device_id = self.gui.names.query(device_name)
             output_input_names = self.gui.devices.fetch_device_output_names(device_id)
@@ -124,6 +125,7 @@ class MonitorAddButton(wx.Button):
                                      self.gui.theme)
             if dialog.ShowModal() == wx.ID_OK:
                 device_port = dialog.get_selected_item()
+            dialog.Destroy()
             if device_port:
                 identifier_dialog = IdentifierInputDialog(self.gui, _(u"Enter Identifier"),
                                                           _(u"Please enter an identifier for the monitor:"),
@@ -133,8 +135,8 @@ class MonitorAddButton(wx.Button):
 
                 else:
                     identifier = None
+                identifier_dialog.Destroy()
 
-                device_id = self.gui.names.query(device_name)
                 port_id = self.gui.names.query(device_port) if device_port != "output" else None
                 if identifier and isinstance(identifier, str) and identifier[0].isalpha():
                     error_type = self.gui.monitors.make_monitor(device_id, port_id, identifier)
@@ -149,7 +151,6 @@ class MonitorAddButton(wx.Button):
                                   "\n(Alphanumerics starting with an alphabet)"),
                                   _(u"Error"), wx.OK | wx.ICON_ERROR)
                 self.gui.update_add_remove_button_states()
-        dialog.Destroy()
 
 
 class MonitorRemoveButton(wx.Button):
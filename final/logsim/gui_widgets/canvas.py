@@ -7,11 +7,23 @@ Classes:
 --------
 MyGLCanvas - handles all canvas drawing operations.
 """
+import os
 import wx
 import wx.glcanvas as wxcanvas
 import math
 import numpy as np
-from OpenGL import GL, GLU, GLUT
+
+import OpenGL
+
+# PyOpenGL checks glGetError after every call by default, which dominates the draw time.
+# The checks can be turned back on for debugging by setting LOGSIM_GL_DEBUG=1.
+if not os.environ.get("LOGSIM_GL_DEBUG"):
+    OpenGL.ERROR_CHECKING = False
+    OpenGL.ERROR_LOGGING = False
+    OpenGL.STORE_POINTERS = False  # vertex arrays are kept alive until they are drawn
+
+from OpenGL import GL, GLU
+from OpenGL.arrays import vbo
 
 
 class Canvas(wxcanvas.GLCanvas):
@@ -41,8 +53,15 @@ class Canvas(wxcanvas.GLCanvas):
 
     on_mouse(self, event): Handles mouse events.
 
-    render_text(self, text, x_pos, y_pos): Handles text drawing
-                                           operations.
+    request_redraw(self): Schedules a single redraw for a burst of mouse events.
+
+    flush_redraw(self): Redraws the canvas once the scheduled redraw runs.
+
+    build_glyph_atlas(self): Rasterises the printable ASCII glyphs into a texture atlas.
+
+    render_text(self, text, x_pos, y_pos): Queues text to be drawn in 2D.
+
+    draw_text_2d(self): Draws all the queued 2D text in a single batch.
 
     render_text_3d(self, text, x_pos, y_pos, z_pos): Handle text drawing operations for 3D.
 
@@ -61,13 +80,14 @@ class Canvas(wxcanvas.GLCanvas):
     screenshot(self): Captures the current canvas and returns an image.
     """
 
+    glut = None  # GLUT module shared by every canvas, imported and initialised on first use
+
     def __init__(self, parent):
         """Initialise canvas properties and useful variables."""
         super().__init__(parent, -1,
                          attribList=[wxcanvas.WX_GL_RGBA,
                                      wxcanvas.WX_GL_DOUBLEBUFFER,
                                      wxcanvas.WX_GL_DEPTH_SIZE, 16, 0])
-        GLUT.glutInit()
         self.init = False
         self.context = wxcanvas.GLContext(self)
         self.gui = parent
@@ -112,6 +132,13 @@ class Canvas(wxcanvas.GLCanvas):
         self.last_mouse_x = 0  # previous mouse x position
         self.last_mouse_y = 0  # previous mouse y position
 
+        # Flag to coalesce the redraws requested by mouse events
+        self.pending_redraw = False
+
+        # Last rendered frame, used to skip redraws when nothing has changed
+        self.last_rendered_text = None
+        self.dirty = True
+
         # Initialise variables for zooming
         self.zoom = 1
         self.zoom_current = 1
@@ -149,6 +176,22 @@ class Canvas(wxcanvas.GLCanvas):
         # Offset between viewpoint and origin of the scene
         self.depth_offset = 1000
 
+        # Glyph atlas for 2D text, kept for the lifetime of the canvas
+        self.atlas_size = 256
+        self.atlas_texture = None  # texture name, uploaded once the context is current
+        self.glyphs = {}  # {character: (u0, v0, u1, v1, advance)}
+        self.glyph_height = 0
+        self.glyph_descent = 0
+        self.glyph_atlas = self.build_glyph_atlas()
+        self.text_vertices = []  # [x, y, ...] of the glyph quads queued for the current frame
+        self.text_tex_coords = []  # [u, v, ...] matching text_vertices
+
+        # Vertex buffer for the 2D traces, rebuilt only when the signals change
+        self.trace_vbo = None
+        self.trace_ranges = []  # [(first vertex, vertex count)] of each trace in the buffer
+        self.trace_identifiers = {}  # identifiers the vertex buffer was built for
+        self.traces_changed = True
+
         # Bind events to the canvas
         self.Bind(wx.EVT_PAINT, self.on_paint)
         self.Bind(wx.EVT_SIZE, self.on_size)
@@ -159,8 +202,24 @@ class Canvas(wxcanvas.GLCanvas):
         size = self.GetClientSize()
         self.SetCurrent(self.context)
 
+        if Canvas.glut is None:
+            # GLUT is only needed for the 3D labels, so it is set up once a canvas is drawn
+            from OpenGL import GLUT
+            GLUT.glutInit()
+            Canvas.glut = GLUT
+
         GL.glClearColor(*self.color_background)
 
+        if self.atlas_texture is None:
+            # Upload the glyph atlas once, it is never cleared on reset
+            self.atlas_texture = GL.glGenTextures(1)
+            GL.glBindTexture(GL.GL_TEXTURE_2D, self.atlas_texture)
+            GL.glPixelStorei(GL.GL_UNPACK_ALIGNMENT, 1)
+            GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, GL.GL_NEAREST)
+            GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, GL.GL_NEAREST)
+            GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, GL.GL_ALPHA, self.atlas_size, self.atlas_size, 0,
+                            GL.GL_ALPHA, GL.GL_UNSIGNED_BYTE, self.glyph_atlas)
+
         if self.mode == "2D":
             GL.glDrawBuffer(GL.GL_BACK)
             GL.glViewport(0, 0, size.width, size.height)
@@ -219,6 +278,15 @@ class Canvas(wxcanvas.GLCanvas):
 
     def render(self, text: str, signals={}) -> None:
         """Handle all drawing operations."""
+        if signals:
+            self.signals = signals  # updating the dictionary of signal values
+            self.traces_changed = True
+            self.dirty = True
+
+        # Skip the frame if nothing has changed since the last one was drawn
+        if text == self.last_rendered_text and self.init and not self.dirty:
+            return
+
         self.SetCurrent(self.context)
         if not self.init:
             # Configure the viewport, modelview and projection matrices
@@ -228,9 +296,6 @@ class Canvas(wxcanvas.GLCanvas):
         # Clear everything
         GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
 
-        if signals:
-            self.signals = signals  # updating the dictionary of signal values
-
         if self.signals:
             identifier_dict = self.gui.monitors.fetch_identifier_to_device_port_name()
             no_of_monitors = len(identifier_dict.keys())
@@ -251,11 +316,7 @@ class Canvas(wxcanvas.GLCanvas):
                 else:
                     self.render_text(str(self.no_cycles), x_start + width * self.no_cycles, y_start - 20)
 
-                for index, (identifier, (device_name, port_name)) in enumerate(identifier_dict.items()):
-                    device_id = self.gui.names.query(device_name)
-                    port_id = self.gui.names.query(port_name) if port_name else None
-                    trace = self.signals[(device_id, port_id)]
-
+                for index, identifier in enumerate(identifier_dict.keys()):
                     # Update y
                     y = y_start + index * y_diff
 
@@ -266,33 +327,13 @@ class Canvas(wxcanvas.GLCanvas):
                     self.render_text("0", 40, y)
                     self.render_text("1", 40, y + height)
 
-                    # Check x starting position
-                    if self.total_cycles > len(trace):
-                        x_start += (self.total_cycles - len(trace)) * width
-
-                    # Update x
-                    x = x_start
-                    x_next = x_start + width
-
-                    GL.glColor3f(*self.color_trace)
-                    GL.glLineWidth(self.width_trace)
-                    GL.glBegin(GL.GL_LINE_STRIP)
+                # The traces only change with the signals, draw them from the vertex buffer
+                if self.traces_changed or identifier_dict != self.trace_identifiers:
+                    self.build_traces_2d(identifier_dict, x_start, y_start, width, height, y_diff)
+                self.draw_traces_2d()
 
-                    for value in trace:
-                        if value == 0:
-                            y_curr = y
-                        elif value == 1:
-                            y_curr = y + height
-
-                        GL.glVertex2f(x, y_curr)
-                        GL.glVertex2f(x_next, y_curr)
-
-                        # Update x
-                        x = x_next
-                        x_next += width
-
-                    GL.glEnd()
-                    x_start = 60
+                # All the 2D text of the frame is drawn with a single draw call
+                self.draw_text_2d()
 
             elif self.mode == "3D":
                 x_start = 60
@@ -348,6 +389,63 @@ class Canvas(wxcanvas.GLCanvas):
         GL.glFlush()
         self.SwapBuffers()
 
+        self.last_rendered_text = text
+        self.dirty = False
+
+    def build_traces_2d(self, identifier_dict: dict, x_start: int, y_start: int,
+                        width: int, height: int, y_diff: int) -> None:
+        """Build the vertex buffer holding the 2D signal traces."""
+        strips = []
+        self.trace_ranges = []
+        first = 0
+
+        for index, (device_name, port_name) in enumerate(identifier_dict.values()):
+            device_id = self.gui.names.query(device_name)
+            port_id = self.gui.names.query(port_name) if port_name else None
+            trace = self.signals[(device_id, port_id)]
+
+            y = y_start + index * y_diff
+
+            # Check x starting position
+            x = x_start
+            if self.total_cycles > len(trace):
+                x += (self.total_cycles - len(trace)) * width
+
+            # Each cycle is a horizontal segment from x to x + width at the signal level
+            steps = np.arange(2 * len(trace))
+            x_values = x + width * ((steps + 1) // 2)
+            y_values = np.repeat(y + height * (np.asarray(trace) == 1), 2)
+
+            strips.append(np.column_stack((x_values, y_values)))
+            self.trace_ranges.append((first, len(steps)))
+            first += len(steps)
+
+        if first:
+            vertices = np.concatenate(strips).astype(np.float32)
+            if self.trace_vbo is None:
+                self.trace_vbo = vbo.VBO(vertices)
+            else:
+                self.trace_vbo.set_array(vertices)
+
+        self.trace_identifiers = identifier_dict
+        self.traces_changed = False
+
+    def draw_traces_2d(self) -> None:
+        """Draw the 2D signal traces from the vertex buffer."""
+        if not any(count for __, count in self.trace_ranges):
+            return
+
+        GL.glColor3f(*self.color_trace)
+        GL.glLineWidth(self.width_trace)
+
+        self.trace_vbo.bind()
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glVertexPointer(2, GL.GL_FLOAT, 0, self.trace_vbo)
+        for first, count in self.trace_ranges:
+            GL.glDrawArrays(GL.GL_LINE_STRIP, first, count)
+        GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+        self.trace_vbo.unbind()
+
     def plot_grid(self, x_start: int, no_of_monitors: int, cycles: int) -> None:
         """Adds grid lines to the plot in 2D."""
         width = 30
@@ -492,6 +590,8 @@ class Canvas(wxcanvas.GLCanvas):
             self.init_gl()
             self.init = True
 
+        # The window contents may have been damaged, always redraw
+        self.dirty = True
         self.render("")
 
     def on_size(self, event) -> None:
@@ -499,94 +599,171 @@ class Canvas(wxcanvas.GLCanvas):
         # Forces reconfiguration of the viewport, modelview and projection
         # matrices on the next paint event
         self.init = False
+        self.dirty = True
 
     def on_mouse(self, event) -> None:
         """Handle mouse events."""
+        # Query the event once, this handler runs on every mouse move
+        x = event.GetX()
+        y = event.GetY()
+        wheel_rotation = event.GetWheelRotation()
+
+        if event.ButtonDown():
+            self.last_mouse_x = x
+            self.last_mouse_y = y
+
         if self.mode == "2D":
-            # Calculate object coordinates of the mouse position
-            size = self.GetClientSize()
-            ox = (event.GetX() - self.pan_x) / self.zoom
-            oy = (size.height - event.GetY() - self.pan_y) / self.zoom
-            old_zoom = self.zoom
-            if event.ButtonDown():
-                self.last_mouse_x = event.GetX()
-                self.last_mouse_y = event.GetY()
+            if wheel_rotation:
+                # Calculate object coordinates of the mouse position
+                size = self.GetClientSize()
+                ox = (x - self.pan_x) / self.zoom
+                oy = (size.height - y - self.pan_y) / self.zoom
             if event.Dragging():
-                self.pan_x += event.GetX() - self.last_mouse_x
-                self.pan_y -= event.GetY() - self.last_mouse_y
-                self.last_mouse_x = event.GetX()
-                self.last_mouse_y = event.GetY()
-                self.init = False
-            if event.GetWheelRotation() < 0:
-                self.zoom *= (1.0 + (
-                        event.GetWheelRotation() / (20 * event.GetWheelDelta())))
-                # Adjust pan so as to zoom around the mouse position
-                self.pan_x -= (self.zoom - old_zoom) * ox
-                self.pan_y -= (self.zoom - old_zoom) * oy
-                self.init = False
-            if event.GetWheelRotation() > 0:
-                self.zoom /= (1.0 - (
-                        event.GetWheelRotation() / (20 * event.GetWheelDelta())))
-                # Adjust pan so as to zoom around the mouse position
-                self.pan_x -= (self.zoom - old_zoom) * ox
-                self.pan_y -= (self.zoom - old_zoom) * oy
+                self.pan_x += x - self.last_mouse_x
+                self.pan_y -= y - self.last_mouse_y
+                self.last_mouse_x = x
+                self.last_mouse_y = y
                 self.init = False
 
-            self.Refresh()  # triggers the paint event
-
         elif self.mode == "3D":
-            self.SetCurrent(self.context)
-
-            if event.ButtonDown():
-                self.last_mouse_x = event.GetX()
-                self.last_mouse_y = event.GetY()
-
             if event.Dragging():
+                self.SetCurrent(self.context)
                 GL.glMatrixMode(GL.GL_MODELVIEW)
                 GL.glLoadIdentity()
-                x = event.GetX() - self.last_mouse_x
-                y = event.GetY() - self.last_mouse_y
+                delta_x = x - self.last_mouse_x
+                delta_y = y - self.last_mouse_y
                 if event.LeftIsDown():
-                    GL.glRotatef(math.sqrt((x * x) + (y * y)), y, x, 0)
+                    GL.glRotatef(math.sqrt((delta_x * delta_x) + (delta_y * delta_y)), delta_y, delta_x, 0)
                 if event.MiddleIsDown():
-                    GL.glRotatef((x + y), 0, 0, 1)
+                    GL.glRotatef((delta_x + delta_y), 0, 0, 1)
                 if event.RightIsDown():
-                    self.pan_x += x
-                    self.pan_y -= y
+                    self.pan_x += delta_x
+                    self.pan_y -= delta_y
                 GL.glMultMatrixf(self.scene_rotate)
                 GL.glGetFloatv(GL.GL_MODELVIEW_MATRIX, self.scene_rotate)
-                self.last_mouse_x = event.GetX()
-                self.last_mouse_y = event.GetY()
+                self.last_mouse_x = x
+                self.last_mouse_y = y
                 self.init = False
 
-            if event.GetWheelRotation() < 0:
-                self.zoom *= (1.0 + (
-                        event.GetWheelRotation() / (20 * event.GetWheelDelta())))
-                self.init = False
+        if wheel_rotation:
+            old_zoom = self.zoom
+            zoom_ratio = wheel_rotation / (20 * (event.GetWheelDelta() or 1))
+            if wheel_rotation < 0:
+                self.zoom *= (1.0 + zoom_ratio)
+            else:
+                self.zoom /= (1.0 - zoom_ratio)
+            if self.mode == "2D":
+                # Adjust pan so as to zoom around the mouse position
+                self.pan_x -= (self.zoom - old_zoom) * ox
+                self.pan_y -= (self.zoom - old_zoom) * oy
+            self.init = False
 
-            if event.GetWheelRotation() > 0:
-                self.zoom /= (1.0 - (
-                        event.GetWheelRotation() / (20 * event.GetWheelDelta())))
-                self.init = False
+        if not self.init:
+            self.request_redraw()
+
+    def request_redraw(self) -> None:
+        """Schedule a single redraw for all mouse events received before it runs."""
+        # The view only changes when init is cleared, so plain mouse moves never redraw
+        if not self.pending_redraw:
+            self.pending_redraw = True
+            wx.CallAfter(self.flush_redraw)
+
+    def flush_redraw(self) -> None:
+        """Redraw the canvas once with the accumulated pan, zoom and rotation."""
+        self.pending_redraw = False
+        self.render("")
 
-            self.Refresh()  # triggers the paint event
+    def build_glyph_atlas(self) -> np.ndarray:
+        """Rasterise the printable ASCII glyphs into a single alpha texture atlas."""
+        size = self.atlas_size
+        bitmap = wx.Bitmap(size, size)
+        dc = wx.MemoryDC(bitmap)
+        dc.SetBackground(wx.BLACK_BRUSH)
+        dc.Clear()
+        dc.SetFont(wx.Font(9, wx.SWISS, wx.NORMAL, wx.NORMAL, False, 'Helvetica'))
+        dc.SetTextForeground(wx.WHITE)
+
+        self.glyph_height = dc.GetCharHeight()
+        self.glyph_descent = dc.GetFullTextExtent("g")[2]
+
+        x = 0
+        y = 0
+        for code in range(32, 127):
+            character = chr(code)
+            advance = dc.GetTextExtent(character).width
+            if x + advance > size:
+                # Start a new row of glyphs
+                x = 0
+                y += self.glyph_height + 1
+            dc.DrawText(character, x, y)
+            self.glyphs[character] = (x / size, y / size, (x + advance) / size,
+                                      (y + self.glyph_height) / size, advance)
+            x += advance + 1  # 1 pixel padding to avoid bleeding between glyphs
+
+        dc.SelectObject(wx.NullBitmap)
+
+        # Text is drawn white on black, so any colour channel can be used as alpha
+        pixels = np.frombuffer(bytes(bitmap.ConvertToImage().GetData()), dtype=np.uint8)
+        return np.ascontiguousarray(pixels.reshape(size, size, 3)[:, :, 0])
 
     def render_text(self, text: str, x_pos: int, y_pos: int) -> None:
-        """Handle text drawing operations for 2D."""
-        GL.glDisable(GL.GL_LIGHTING)
-        GL.glColor3f(*self.color_text)
-        GL.glRasterPos2f(x_pos, y_pos)
-        font = GLUT.GLUT_BITMAP_HELVETICA_12
+        """Queue the glyph quads of the text, which are drawn with the rest of the frame's 2D text."""
+        # Glyph sizes are in pixels, undo the zoom so text keeps its size on screen
+        scale = 1 / self.zoom
+        glyphs = self.glyphs
+        fallback = glyphs["?"]
+        vertices = self.text_vertices
+        tex_coords = self.text_tex_coords
+        y0 = y_pos - self.glyph_descent * scale
+        y1 = y0 + self.glyph_height * scale
+        x0 = x_pos
 
         for character in text:
             if character == '\n':
-                y_pos = y_pos - 20
-                GL.glRasterPos2f(x_pos, y_pos)
-            else:
-                GLUT.glutBitmapCharacter(font, ord(character))
+                y0 -= 20
+                y1 -= 20
+                x0 = x_pos
+                continue
+
+            u0, v0, u1, v1, advance = glyphs.get(character, fallback)
+            x1 = x0 + advance * scale
+            vertices.extend((x0, y0, x1, y0, x1, y1, x0, y0, x1, y1, x0, y1))
+            tex_coords.extend((u0, v1, u1, v1, u1, v0, u0, v1, u1, v0, u0, v0))
+            x0 = x1
+
+    def draw_text_2d(self) -> None:
+        """Draw all the text queued by render_text as a single batch of textured quads."""
+        if not self.text_vertices:
+            return
+
+        vertices = np.array(self.text_vertices, dtype=np.float32)
+        tex_coords = np.array(self.text_tex_coords, dtype=np.float32)
+        self.text_vertices.clear()
+        self.text_tex_coords.clear()
+
+        GL.glDisable(GL.GL_LIGHTING)
+        GL.glColor3f(*self.color_text)
+
+        GL.glPushAttrib(GL.GL_ENABLE_BIT | GL.GL_COLOR_BUFFER_BIT)
+        GL.glEnable(GL.GL_TEXTURE_2D)
+        GL.glBindTexture(GL.GL_TEXTURE_2D, self.atlas_texture)
+        GL.glEnable(GL.GL_BLEND)
+        GL.glBlendFunc(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
+
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glEnableClientState(GL.GL_TEXTURE_COORD_ARRAY)
+        GL.glVertexPointer(2, GL.GL_FLOAT, 0, vertices)
+        GL.glTexCoordPointer(2, GL.GL_FLOAT, 0, tex_coords)
+        GL.glDrawArrays(GL.GL_TRIANGLES, 0, len(vertices) // 2)
+        GL.glDisableClientState(GL.GL_TEXTURE_COORD_ARRAY)
+        GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+
+        GL.glPopAttrib()
 
     def render_text_3d(self, text: str, x_pos: int, y_pos: int, z_pos: int) -> None:
         """Handle text drawing operations for 3D."""
+        GLUT = self.glut
+
         GL.glDisable(GL.GL_LIGHTING)
         GL.glColor3f(*self.color_text)
         GL.glRasterPos3f(x_pos, y_pos, z_pos)
@@ -625,6 +802,7 @@ class Canvas(wxcanvas.GLCanvas):
 
         GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
         self.SwapBuffers()
+        self.dirty = True
 
     def reset_display(self) -> None:
         """Return to the initial viewpoint at the origin."""
@@ -652,6 +830,8 @@ class Canvas(wxcanvas.GLCanvas):
         self.SetCurrent(self.context)
         GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
         self.signals.clear()
+        self.traces_changed = True
+        self.dirty = True
         self.init = False
         self.Refresh()
 
@@ -670,6 +850,7 @@ class Canvas(wxcanvas.GLCanvas):
             self.grid_on = False
         else:
             self.grid_on = True
+        self.dirty = True
         self.render("")
 
     def screenshot(self) -> wx._core.Image:
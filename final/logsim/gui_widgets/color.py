@@ -6,6 +6,7 @@ Classes:
 --------
 Color - contains all colors used for decorating the graphical user interface.
 """
+import wx
 
 
 class Color:
@@ -20,26 +21,26 @@ class Color:
     --------------
     No public methods.
     """
-    # Colour styles
-    color_primary = "#4DA2B4"
-    color_primary_shade = "#397E8D"
-    color_disabled = "#CBBBBB"
+    # Colour styles, created once as wx.Colour so wx does not parse hex strings on every use
+    color_primary = wx.Colour("#4DA2B4")
+    color_primary_shade = wx.Colour("#397E8D")
+    color_disabled = wx.Colour("#CBBBBB")
 
     # UI Theme Colours - Light Mode
-    light_button_color = "#EAEAEA"
-    light_background_color = "#DDDDDD"
-    light_background_secondary = "#FAFAFA"
-    light_text_color = "#000000"
+    light_button_color = wx.Colour("#EAEAEA")
+    light_background_color = wx.Colour("#DDDDDD")
+    light_background_secondary = wx.Colour("#FAFAFA")
+    light_text_color = wx.Colour("#000000")
 
     # UI Theme Colours - Dark Mode
-    dark_button_color = "#555555"
-    dark_background_color = "#333333"
-    dark_background_secondary = "#444444"
-    dark_text_color = "#FFFFFF"
+    dark_button_color = wx.Colour("#555555")
+    dark_background_color = wx.Colour("#333333")
+    dark_background_secondary = wx.Colour("#444444")
+    dark_text_color = wx.Colour("#FFFFFF")
 
     # Terminal Colours
-    terminal_background_color = "#222222"
-    terminal_text_color = "#FFFFFF"
-    terminal_success_color = "#16C60C"
-    terminal_warning_color = "#F9F1A5"
-    terminal_error_color = "#E74856"
+    terminal_background_color = wx.Colour("#222222")
+    terminal_text_color = wx.Colour("#FFFFFF")
+    terminal_success_color = wx.Colour("#16C60C")
+    terminal_warning_color = wx.Colour("#F9F1A5")
+    terminal_error_color = wx.Colour("#E74856")
@@ -25,7 +25,11 @@ class MonitorsList:
 
     Public methods
     --------------
+    get_monitor_label(self, text, color): Return the cached label displaying the text.
+
     update_monitors_list(self): Handle the event of updating the list of monitors upon change.
+
+    clear_monitors_list(self): Destroy all displayed monitor labels.
     """
 
     def __init__(self, parent):
@@ -37,39 +41,69 @@ class MonitorsList:
         self.monitors_scrolled = wx.ScrolledWindow(parent, style=wx.VSCROLL)
         self.monitors_scrolled.SetScrollRate(10, 10)
         self.monitors_scrolled_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.monitor_labels = []  # labels currently displayed, kept for theme changes
+        self.monitor_label_cache = dict()  # {label text: label}, reused between updates
 
         self.monitors_scrolled.SetMinSize((250, 150))
         self.monitors_scrolled.SetBackgroundColour(Color.light_background_secondary)
         self.monitors_sizer.Add(self.monitors_text, 0, wx.ALL, 5)
         self.monitors_sizer.Add(self.monitors_scrolled, 1, wx.EXPAND | wx.ALL, 5)
 
+    def get_monitor_label(self, text: str, color: wx.Colour) -> wx.StaticText:
+        """Return the cached label displaying the given text, creating it if needed."""
+        label = self.monitor_label_cache.get(text)
+        if label is None:
+            label = wx.StaticText(self.monitors_scrolled, wx.ID_ANY, text)
+            label.SetForegroundColour(color)
+            self.monitor_label_cache[text] = label
+        return label
+
     def update_monitors_list(self) -> None:
         """Handle the event of updating the list of monitors upon change."""
+        self.monitors_scrolled.Freeze()
+        try:
+            # Detach the labels from the sizer without destroying them
+            self.monitors_scrolled_sizer.Clear(False)
+
+            # Change text colour depending on theme
+            if self.gui.theme == "light":
+                color = Color.light_text_color
+            else:
+                color = Color.dark_text_color
+
+            if not self.gui.monitors.get_all_identifiers():
+                # Empty list, displays a message saying "No active monitors"
+                texts = [_(u"No active monitors")]
+                flags = wx.ALL | wx.CENTER
+            else:
+                # Populate the display if there are active monitors
+                texts = []
+                for identifier, (
+                        device_name, port_name) in self.gui.monitors.fetch_identifier_to_device_port_name().items():
+                    if port_name:
+                        texts.append(f"{identifier}: {device_name}.{port_name}")
+                    else:
+                        texts.append(f"{identifier}: {device_name}")
+                flags = wx.ALL | wx.EXPAND
+
+            # Only destroy the labels which are no longer displayed
+            displayed_texts = set(texts)
+            for text in list(self.monitor_label_cache):
+                if text not in displayed_texts:
+                    self.monitor_label_cache.pop(text).Destroy()
+
+            self.monitor_labels = [self.get_monitor_label(text, color) for text in texts]
+            self.monitors_scrolled_sizer.AddMany([(monitor_label, 0, flags, 5) for monitor_label in self.monitor_labels])
+
+            self.monitors_scrolled.SetSizer(self.monitors_scrolled_sizer)
+            self.monitors_scrolled.Layout()
+            self.monitors_scrolled_sizer.FitInside(self.monitors_scrolled)
+            self.monitors_scrolled_sizer.Layout()
+        finally:
+            self.monitors_scrolled.Thaw()
+
+    def clear_monitors_list(self) -> None:
+        """Destroy all displayed monitor labels."""
         self.monitors_scrolled_sizer.Clear(True)
-
-        # Change text colour depending on theme
-        if self.gui.theme == "light":
-            color = Color.light_text_color
-        else:
-            color = Color.dark_text_color
-
-        if not self.gui.monitors.get_all_identifiers():
-            # Empty list, displays a message saying "No active monitors"
-            no_monitor_text = wx.StaticText(self.monitors_scrolled, wx.ID_ANY, _(u"No active monitors"))
-            no_monitor_text.SetForegroundColour(color)
-            self.monitors_scrolled_sizer.Add(no_monitor_text, 0, wx.ALL | wx.CENTER, 5)
-        else:
-            # Populate the display if there are active monitors
-            for identifier, (
-                    device_name, port_name) in self.gui.monitors.fetch_identifier_to_device_port_name().items():
-                output = identifier + ": " + device_name
-                if port_name:
-                    output += "." + port_name
-                monitor_label = wx.StaticText(self.monitors_scrolled, wx.ID_ANY, output)
-                monitor_label.SetForegroundColour(color)
-                self.monitors_scrolled_sizer.Add(monitor_label, 0, wx.ALL | wx.EXPAND, 5)
-
-        self.monitors_scrolled.SetSizer(self.monitors_scrolled_sizer)
-        self.monitors_scrolled.Layout()
-        self.monitors_scrolled_sizer.FitInside(self.monitors_scrolled)
-        self.monitors_scrolled_sizer.Layout()
+        self.monitor_label_cache = dict()
+        self.monitor_labels = []
@@ -44,6 +44,8 @@ class Switch:
         self.switches_scrolled = wx.ScrolledWindow(parent, style=wx.VSCROLL)
         self.switches_scrolled.SetScrollRate(10, 10)
         self.switches_scrolled_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.switch_labels = []  # labels currently displayed, kept for theme changes
+        self.switch_toggles = []  # toggle buttons currently displayed, kept for theme changes
 
         self.switches_scrolled.SetSizer(self.switches_scrolled_sizer)
         self.switches_scrolled.SetMinSize((250, 150))
@@ -67,7 +69,9 @@ class Switch:
             button.SetLabel("0")
             self.switches_dict[switch_name] = 0
             self.gui.devices.set_switch(switch_id, 0)
-        self.gui.Refresh()
+
+        # Only the toggled button changes, so the rest of the window is not repainted
+        button.Refresh()
 
     def update_switches_display(self) -> None:
         """Handle the event of updating the displayed list of switches."""
@@ -81,7 +85,10 @@ class Switch:
             self.switches_dict[switch_name] = switch_state
 
         self.switches_scrolled_sizer.Clear(True)
+        self.switch_labels = []
+        self.switch_toggles = []
 
+        switch_items = []  # [(switch sizer, proportion, flag, border)] added to the sizer at once
         for switch, state in self.switches_dict.items():
             switch_sizer = wx.BoxSizer(wx.HORIZONTAL)
 
@@ -104,10 +111,14 @@ class Switch:
                 toggle.SetBackgroundColour(Color.dark_button_color)
 
             self.toggle_button_switch_name[toggle.GetId()] = switch
+            self.switch_labels.append(label)
+            self.switch_toggles.append(toggle)
 
             switch_sizer.Add(toggle, 0, wx.ALIGN_CENTER_VERTICAL)
 
-            self.switches_scrolled_sizer.Add(switch_sizer, 0, wx.EXPAND | wx.ALL, 5)
+            switch_items.append((switch_sizer, 0, wx.EXPAND | wx.ALL, 5))
+
+        self.switches_scrolled_sizer.AddMany(switch_items)
 
         self.switches_scrolled.SetSizer(self.switches_scrolled_sizer)
         self.switches_scrolled.Layout()
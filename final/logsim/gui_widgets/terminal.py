@@ -30,6 +30,7 @@ class Terminal:
     """
     def __init__(self, parent):
         self.welcoming_text = _(u"Welcome to Logic Simulator\n==========================")
+        self.text_styles = dict()  # {RGBA value: text style}, created once per colour
 
         self.border_panel = wx.Panel(parent)
         self.border_panel.SetBackgroundColour(Color.terminal_background_color)
@@ -51,9 +52,12 @@ class Terminal:
         self.border_sizer.Add(self.terminal_panel, 1, wx.EXPAND | wx.ALL, 10)
         self.border_panel.SetSizer(self.border_sizer)
 
-    def append_text(self, color: str, text: str) -> None:
+    def append_text(self, color: wx.Colour, text: str) -> None:
         """Handles the event of adding output messages to the terminal."""
-        self.terminal_content.SetDefaultStyle(wx.TextAttr(color))
+        key = color.GetRGBA()
+        if key not in self.text_styles:
+            self.text_styles[key] = wx.TextAttr(color)
+        self.terminal_content.SetDefaultStyle(self.text_styles[key])
         self.terminal_content.AppendText(text)
 
     def reset_terminal(self) -> None:
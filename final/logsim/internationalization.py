@@ -3,6 +3,15 @@ import wx
 
 _ = wx.GetTranslation
 
+
+def N_(message: str) -> str:
+    """Mark a message for translation without translating it yet.
+
+    Used for messages stored before the locale is set, which are translated with _ when displayed.
+    """
+    return message
+
+
 language_domain = "gui"
 supported_language = {
     u"en_gb.utf-8": wx.LANGUAGE_ENGLISH_UK,
@@ -577,8 +577,6 @@ class Parser:
                 self.error_handler.line_error(self.monitors.MONITOR_IDENTIFIER_PRESENT, identifier_symbol)
             elif error_type == self.monitors.MONITOR_DEVICE_ABSENT:
                 self.error_handler.line_error(self.monitors.MONITOR_DEVICE_ABSENT, device_symbol)
-            elif error_type == self.monitors.MONITOR_PORT_ABSENT:
-                self.error_handler.line_error(self.monitors.MONITOR_PORT_ABSENT, port_symbol)
             else:
                 print(f"Error type: {error_type}, should not be encountered")
 
@@ -10,42 +10,81 @@ FileTerminalOutput - stores terminal outputs for file errors reported by parser.
 ParserErrorHandler - generates terminal outputs from errors reported by the parser.
 """
 
+import functools
+
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
+
 from logsim.names import Names
 from logsim.devices import Devices
 from logsim.network import Network
 from logsim.monitors import Monitors
 from logsim.scanner import Scanner, Symbol
-from logsim.internationalization import _
+from logsim.internationalization import _, N_
 
 
 class LineTerminalOutput:
 
     """Encapsulate a line error and store the error output to display on the terminal.
 
+    The displayed strings are only generated when they are accessed, so errors which are never
+    displayed cost no string formatting.
+
     Parameters
     ----------
-    line_location: string. Contains string with format "Line NUMBER:"
-    line_with_issue: string. Contains a (truncated) copy of the line with issue.
-    arrow: string. Contains the string with "^" symbol at the right location.
-    message: string. Contains the error message.
+    line: integer. Index of the line with issue.
+    character_in_line: integer. Position of the error in the line.
     error_code: integer.
+    name: string. Contains the string representation of the symbol with issue.
+    error_handler: instance of the ParserErrorHandler() class which generates the displayed strings.
 
     Public methods
     --------------
+     line_location(self): Returns a string with format "Line NUMBER:".
+
+     line_with_issue(self): Returns a (truncated) copy of the line with issue.
+
+     arrow(self): Returns the string with "^" symbol at the right location.
+
+     message(self): Returns the error message.
+
      __str__(self): Returns the terminal output representation of the instance.
     """
 
-    def __init__(self, line_location: str, line_with_issue: str, arrow: str, message: str, error_code: int):
+    __slots__ = ("line", "character_in_line", "error_code", "name", "error_handler")
+
+    def __init__(self, line: int, character_in_line: int, error_code: int, name: str,
+                 error_handler: "ParserErrorHandler"):
         """Initialise line terminal output content."""
-        self.line_location = line_location
-        self.line_with_issue = line_with_issue
-        self.arrow = arrow
-        self.message = message
+        self.line = line
+        self.character_in_line = character_in_line
         self.error_code = error_code
-
-    def __str__(self):
+        self.name = name
+        self.error_handler = error_handler
+
+    @property
+    def line_location(self) -> str:
+        """Return a string with format "Line NUMBER:"."""
+        return _(u"Line {line_num}:").format(line_num=self.line + 1)
+
+    @property
+    def line_with_issue(self) -> str:
+        """Return a (truncated) copy of the line with issue."""
+        return self.error_handler.get_line_display(self.line, self.character_in_line)[0]
+
+    @property
+    def arrow(self) -> str:
+        """Return the string with "^" symbol at the right location."""
+        return self.error_handler.get_line_display(self.line, self.character_in_line)[1]
+
+    @property
+    def message(self) -> str:
+        """Return the error message."""
+        return self.error_handler.get_error_message(error_code=self.error_code, name=self.name)
+
+    def __str__(self) -> str:
         """Return the terminal output representation of the instance."""
-        return f"\n{self.line_location}\n{self.line_with_issue}\n{self.arrow}\n{self.message}\n"
+        line_with_issue, arrow = self.error_handler.get_line_display(self.line, self.character_in_line)
+        return f"\n{self.line_location}\n{line_with_issue}\n{arrow}\n{self.message}\n"
 
 
 class FileTerminalOutput:
@@ -62,12 +101,14 @@ class FileTerminalOutput:
      __str__(self): Returns the terminal output representation of the instance.
     """
 
+    __slots__ = ("message", "error_code")
+
     def __init__(self, message: str, error_code: int):
         """Initialise file terminal output content."""
         self.message = message
         self.error_code = error_code
 
-    def __str__(self):
+    def __str__(self) -> str:
         """Return the terminal output representation of the instance."""
         return _(u"\nFile error: {message}\n").format(message=self.message)
 
@@ -95,6 +136,18 @@ class ParserErrorHandler:
 
     """
 
+    # {symbol type: string representation} for symbols without an id
+    punctuation_names = {
+        Scanner.COMMA: ",",
+        Scanner.SEMICOLON: ";",
+        Scanner.COLON: ":",
+        Scanner.FULL_STOP: ".",
+        Scanner.ARROW: ">",
+        Scanner.OPEN_CURLY_BRACKET: "{",
+        Scanner.CLOSE_CURLY_BRACKET: "}",
+        Scanner.EOF: ""
+    }
+
     def __init__(self, names: Names, devices: Devices, network: Network, monitors: Monitors, scanner: Scanner):
         """Initialise constants."""
         self.names = names
@@ -102,7 +155,7 @@ class ParserErrorHandler:
         self.network = network
         self.monitors = monitors
         self.scanner = scanner
-        self.error_output_list = []
+        self.error_output_list: List[Union[LineTerminalOutput, FileTerminalOutput, str]] = []
 
         # line error
         [self.EXPECT_IDENTIFIER, self.EXPECT_INPUT_DEVICE, self.EXPECT_VARIABLE_INPUT_NUMBER,
@@ -115,32 +168,77 @@ class ParserErrorHandler:
         # file error
         [self.MISSING_INPUT_TO_PIN, self.MISSING_MONITOR, self.MISSING_CLOCK_OR_SWITCH] = names.unique_error_codes(3)
 
+        # {error code: message template}, templates are translated when the message is generated
+        self.error_messages: Dict[int, str] = {
+            # syntax line error
+            self.EXPECT_IDENTIFIER: N_(u"Found {name}, expected a non-keyword identifier"),
+            self.EXPECT_INPUT_DEVICE: N_(u"Found {name}, expected 'AND', 'NAND', 'OR', 'NOR', 'XOR', 'DTYPE' or 'RC'"),
+            self.EXPECT_VARIABLE_INPUT_NUMBER: N_(u"Found {name}, expected integer between 1 and 16"),
+            self.EXPECT_CLOCK_CYCLE: N_(u"Found {name}, expected positive integer with no leading zero"),
+            self.EXPECT_RC_TRIGGER_CYCLE: N_(u"Found {name}, expected positive integer with no leading zero"),
+            self.EXPECT_INITIAL_STATE: N_(u"Found {name}, expected 0 or 1"),
+            self.EXPECT_PIN_IN: N_(u"Found {name}, expected 'I1-16', 'DATA', 'CLK', 'SET' or 'CLEAR'"),
+            self.EXPECT_PIN_OUT: N_(u"Found {name}, expected 'Q' or 'QBAR'"),
+            # for ( pinIn | pinOut ) in monitor
+            self.EXPECT_PIN_IN_OR_OUT: N_(u"Found {name}, expected 'I1-16', 'DATA', 'CLK', 'SET', 'CLEAR', 'Q' or 'QBAR'"),
+            self.EXPECT_KEYWORD:
+                N_(u"Found {name}, expected a keyword ('DEVICE', 'CLOCK', 'SWITCH', 'MONITOR' or 'CONNECTION')"),
+            self.EXPECT_OPEN_CURLY_BRACKET: N_(u"Found {name}, expected '{{'"),
+            self.EXPECT_COMMA: N_(u"Found {name}, expected ','"),
+            self.EXPECT_SEMICOLON: N_(u"Found {name}, expected ';'"),
+            self.EXPECT_COLON: N_(u"Found {name}, expected ':'"),
+            # for [ ".", ( pinIn | pinOut ) ], ";" in monitor
+            self.EXPECT_FULL_STOP_OR_SEMICOLON:
+                N_(u"Found {name}, expected '.' (if pin has to be defined) or ';' (if pin does not have to be defined)"),
+            self.EXPECT_FULL_STOP: N_(u"Found {name}, expected '.'"),
+            self.EXPECT_ARROW: N_(u"Found {name}, expected '>'"),
+            # for [".", pinOut] , ">" in connection
+            self.EXPECT_FULL_STOP_OR_ARROW:
+                N_(u"Found {name}, expected '.' (if pin has to be defined) or '>' (if pin does not have to be defined)"),
+            self.DUPLICATE_KEYWORD: N_(u"{name} block should not be redefined"),
+            self.WRONG_BLOCK_ORDER: N_(u"{name} block order is wrong"),
+            self.EXPECT_CLOSE_CURLY_BRACKET: N_(u"Found {name}, expected '}}'"),
+
+            # semantic line error
+            network.INPUT_PORT_ABSENT: N_(u"Pin {name} does not exist"),
+            network.OUTPUT_PORT_ABSENT: N_(u"Pin {name} does not exist"),
+            monitors.MONITOR_PORT_ABSENT: N_(u"Pin {name} does not exist"),
+            network.INPUT_CONNECTED: N_(u"Connection repeatedly assigned to input pin {name}"),
+            network.INPUT_DEVICE_ABSENT: N_(u"Identifier {name} is not defined"),
+            network.OUTPUT_DEVICE_ABSENT: N_(u"Identifier {name} is not defined"),
+            monitors.MONITOR_DEVICE_ABSENT: N_(u"Identifier {name} is not defined"),
+            devices.DEVICE_PRESENT: N_(u"Identifier {name} should not be redefined"),
+            monitors.MONITOR_IDENTIFIER_PRESENT: N_(u"Identifier {name} should not be redefined"),
+
+            # file error
+            self.MISSING_INPUT_TO_PIN: N_(u"Missing input to pin {name}"),
+            self.MISSING_MONITOR: N_(u"At least one monitor should be defined"),
+            self.MISSING_CLOCK_OR_SWITCH: N_(u"At least one list between 'CLOCK' and 'SWITCH' is needed. neither is found")
+        }
+        # error codes whose message has no {name}
+        self.unnamed_error_codes: FrozenSet[int] = frozenset({self.MISSING_MONITOR, self.MISSING_CLOCK_OR_SWITCH})
+        # {error code: translated template}, filled on first use
+        self.translated_messages: Dict[int, str] = dict()
+        # {(line, character_in_line): (truncated line, arrow)}
+        self.line_displays: Dict[Tuple[int, int], Tuple[str, str]] = dict()
+
         self.error_limit = 25
 
+        # Ids are never reassigned, so the name string of each id can be cached
+        self.name_of = functools.lru_cache(maxsize=1024)(self.names.get_name_string)
+
     def symbol_to_name(self, symbol: Symbol) -> str:
         """Return the string representation of the given symbol."""
-        if symbol.id:  # symbol id is not None, i.e. symbol.type is KEYWORD, NUMBER, NAME or INVALID
-            if symbol.type == Scanner.NUMBER or symbol.type == Scanner.INVALID:
-                return symbol.id
+        symbol_id = symbol.id
+        symbol_type = symbol.type
+        if symbol_id:  # symbol id is not None, i.e. symbol.type is KEYWORD, NUMBER, NAME or INVALID
+            if symbol_type == Scanner.NUMBER or symbol_type == Scanner.INVALID:
+                return symbol_id
             else:
-                return self.names.get_name_string(symbol.id)
-        elif symbol.type == Scanner.COMMA:
-            return ","
-        elif symbol.type == Scanner.SEMICOLON:
-            return ";"
-        elif symbol.type == Scanner.COLON:
-            return ":"
-        elif symbol.type == Scanner.FULL_STOP:
-            return "."
-        elif symbol.type == Scanner.ARROW:
-            return ">"
-        elif symbol.type == Scanner.OPEN_CURLY_BRACKET:
-            return "{"
-        elif symbol.type == Scanner.CLOSE_CURLY_BRACKET:
-            return "}"
-        elif symbol.type == Scanner.EOF:
-            return ""
-        else:
+                return self.name_of(symbol_id)
+        try:
+            return self.punctuation_names[symbol_type]
+        except KeyError:
             raise ValueError("Invalid symbol type")
 
     def error_limit_exceeded(self) -> None:
@@ -160,7 +258,7 @@ class ParserErrorHandler:
         elif len(self.error_output_list) == (self.error_limit + 1):
             self.error_limit_exceeded()
 
-    def file_error(self, error_code: int, name: str = "") -> None:
+    def file_error(self, error_code: int, name: Optional[str] = None) -> None:
         """Add terminal output to indicate error occurring in the scope of the whole file."""
         if len(self.error_output_list) <= self.error_limit:
             error_output = FileTerminalOutput(
@@ -174,97 +272,39 @@ class ParserErrorHandler:
     def get_line_terminal_output(self, line: int, character_in_line: int, error_code: int, name: str) -> (
             LineTerminalOutput):
         """Return terminal output based on information of the line error encountered."""
-        left_char_limit = 25
-        right_char_limit = 25
-        line_str = self.scanner.file_lines[line]
-        line_length = len(line_str)
-        if character_in_line > left_char_limit:
-            line_str = "..." + line_str[character_in_line-left_char_limit:]
-            character_in_line = left_char_limit
-        if line_length - character_in_line - 1 > right_char_limit:
-            line_str = line_str[:character_in_line+right_char_limit + 1] + "..."
-        return LineTerminalOutput(
-            line_location=_(u"Line {line_num}:").format(line_num=line + 1),
-            line_with_issue=line_str,
-            arrow=" " * character_in_line + "^",
-            message=self.get_error_message(error_code=error_code, name=name),
-            error_code=error_code
-        )
-
-    def get_error_message(self, error_code: int, name: str = "") -> str:
+        if error_code not in self.error_messages:
+            raise ValueError(f"Invalid error code '{error_code}'")
+        return LineTerminalOutput(line=line, character_in_line=character_in_line, error_code=error_code, name=name,
+                                  error_handler=self)
+
+    def get_line_display(self, line: int, character_in_line: int) -> Tuple[str, str]:
+        """Return the (truncated) line with issue and the arrow pointing at the error."""
+        line_display = self.line_displays.get((line, character_in_line))
+        if line_display is None:
+            left_char_limit = 25
+            right_char_limit = 25
+            line_str = self.scanner.file_lines[line]
+            line_length = len(line_str)
+            arrow_position = character_in_line
+            if arrow_position > left_char_limit:
+                line_str = "..." + line_str[arrow_position-left_char_limit:]
+                arrow_position = left_char_limit
+            if line_length - arrow_position - 1 > right_char_limit:
+                line_str = line_str[:arrow_position+right_char_limit + 1] + "..."
+            line_display = self.line_displays[(line, character_in_line)] = (line_str, "^".rjust(arrow_position + 1))
+        return line_display
+
+    def get_error_message(self, error_code: int, name: Optional[str] = None) -> str:
         """Return the error message based on the error encountered."""
-        name = "\'" + name + "\'"
-        if not (error_code == self.MISSING_CLOCK_OR_SWITCH or error_code == self.MISSING_MONITOR) and not name:
-            raise TypeError(f"error_code = {error_code} has 1 required positional argument: 'name'")
-
-        # syntax line error
-        if error_code == self.EXPECT_IDENTIFIER:
-            return _(u"Found {name}, expected a non-keyword identifier").format(name=name)
-        elif error_code == self.EXPECT_INPUT_DEVICE:
-            return _(u"Found {name}, expected 'AND', 'NAND', 'OR', 'NOR', 'XOR', 'DTYPE' or 'RC'").format(name=name)
-        elif error_code == self.EXPECT_VARIABLE_INPUT_NUMBER:
-            return _(u"Found {name}, expected integer between 1 and 16").format(name=name)
-        elif error_code == self.EXPECT_CLOCK_CYCLE or error_code == self.EXPECT_RC_TRIGGER_CYCLE:
-            return _(u"Found {name}, expected positive integer with no leading zero").format(name=name)
-        elif error_code == self.EXPECT_INITIAL_STATE:
-            return _(u"Found {name}, expected 0 or 1").format(name=name)
-        elif error_code == self.EXPECT_PIN_IN:
-            return _(u"Found {name}, expected 'I1-16', 'DATA', 'CLK', 'SET' or 'CLEAR'").format(name=name)
-        elif error_code == self.EXPECT_PIN_OUT:
-            return _(u"Found {name}, expected 'Q' or 'QBAR'").format(name=name)
-        elif error_code == self.EXPECT_PIN_IN_OR_OUT:  # for ( pinIn | pinOut ) in monitor
-            return _(u"Found {name}, expected 'I1-16', 'DATA', 'CLK', 'SET', 'CLEAR', 'Q' or 'QBAR'").format(name=name)
-        elif error_code == self.EXPECT_KEYWORD:
-            return (_(u"Found {name}, expected a keyword ('DEVICE', 'CLOCK', 'SWITCH', 'MONITOR' or 'CONNECTION')")
-                    .format(name=name))
-        elif error_code == self.EXPECT_OPEN_CURLY_BRACKET:
-            return _(u"Found {name}, expected '{{'").format(name=name)
-        elif error_code == self.EXPECT_COMMA:
-            return _(u"Found {name}, expected ','").format(name=name)
-        elif error_code == self.EXPECT_SEMICOLON:
-            return _(u"Found {name}, expected ';'").format(name=name)
-        elif error_code == self.EXPECT_COLON:
-            return _(u"Found {name}, expected ':'").format(name=name)
-        elif error_code == self.EXPECT_FULL_STOP_OR_SEMICOLON:  # for [ ".", ( pinIn | pinOut ) ], ";" in monitor
-            return (
-                _(u"Found {name}, expected '.' (if pin has to be defined) or ';' (if pin does not have to be defined)")
-                .format(name=name)
-            )
-        elif error_code == self.EXPECT_FULL_STOP:
-            return _(u"Found {name}, expected '.'").format(name=name)
-        elif error_code == self.EXPECT_ARROW:
-            return _(u"Found {name}, expected '>'").format(name=name)
-        elif error_code == self.EXPECT_FULL_STOP_OR_ARROW:  # for [".", pinOut] , ">" in connection
-            return (
-                _(u"Found {name}, expected '.' (if pin has to be defined) or '>' (if pin does not have to be defined)")
-                .format(name=name)
-            )
-        elif error_code == self.DUPLICATE_KEYWORD:
-            return _(u"{name} block should not be redefined").format(name=name)
-        elif error_code == self.WRONG_BLOCK_ORDER:
-            return _(u"{name} block order is wrong").format(name=name)
-        elif error_code == self.EXPECT_CLOSE_CURLY_BRACKET:
-            return _(u"Found {name}, expected '}}'").format(name=name)
-
-        # semantic line error
-        elif (error_code == self.network.INPUT_PORT_ABSENT or error_code == self.network.OUTPUT_PORT_ABSENT or
-              error_code == self.monitors.MONITOR_PORT_ABSENT):
-            return _(u"Pin {name} does not exist").format(name=name)
-        elif error_code == self.network.INPUT_CONNECTED:
-            return _(u"Connection repeatedly assigned to input pin {name}").format(name=name)
-        elif (error_code == self.network.INPUT_DEVICE_ABSENT or error_code == self.network.OUTPUT_DEVICE_ABSENT or
-              error_code == self.monitors.MONITOR_DEVICE_ABSENT):
-            return _(u"Identifier {name} is not defined").format(name=name)
-        elif error_code == self.devices.DEVICE_PRESENT or error_code == self.monitors.MONITOR_IDENTIFIER_PRESENT:
-            return _(u"Identifier {name} should not be redefined").format(name=name)
-
-        # file error
-        elif error_code == self.MISSING_INPUT_TO_PIN:
-            return _(u"Missing input to pin {name}").format(name=name)
-        elif error_code == self.MISSING_MONITOR:
-            return _(u"At least one monitor should be defined")
-        elif error_code == self.MISSING_CLOCK_OR_SWITCH:
-            return _(u"At least one list between 'CLOCK' and 'SWITCH' is needed. neither is found")
-
+        if name is None:
+            if error_code not in self.unnamed_error_codes:
+                raise TypeError(f"error_code = {error_code} has 1 required positional argument: 'name'")
         else:
-            raise ValueError(f"Invalid error code '{error_code}'")
+            name = f"'{name}'"
+
+        template = self.translated_messages.get(error_code)
+        if template is None:
+            if error_code not in self.error_messages:
+                raise ValueError(f"Invalid error code '{error_code}'")
+            template = self.translated_messages[error_code] = _(self.error_messages[error_code])
+        return template.format(name=name)
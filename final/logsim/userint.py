@@ -143,7 +143,7 @@ class UserInterface:
             print("Error! Expected a name.")
             return None
         while self.character.isalnum():
-            name_string = "".join([name_string, self.character])
+            name_string += self.character
             self.get_character()
         return name_string
 
@@ -212,7 +212,7 @@ class UserInterface:
             print("Error! Expected a number.")
             return None
         while self.character.isdigit():
-            number_string = "".join([number_string, self.character])
+            number_string += self.character
             self.get_character()
         number = int(number_string)
 
@@ -294,7 +294,7 @@ class UserInterface:
 
         if cycles is not None:  # if the number of cycles provided is valid
             self.monitors.reset_monitors()
-            print("".join(["Running for ", str(cycles), " cycles"]))
+            print(f"Running for {cycles} cycles")
             self.devices.cold_startup()
             if self.run_network(cycles):
                 self.cycles_completed += cycles
@@ -307,5 +307,4 @@ class UserInterface:
                 print("Error! Nothing to continue. Run first.")
             elif self.run_network(cycles):
                 self.cycles_completed += cycles
-                print(" ".join(["Continuing for", str(cycles), "cycles.",
-                                "Total:", str(self.cycles_completed)]))
+                print(f"Continuing for {cycles} cycles. Total: {self.cycles_completed}")
@@ -282,3 +282,64 @@ def test_parse_extreme_error(new_parser, path):
     """Test if network could be parsed without crashing the parser."""
 
     assert not new_parser.parse_network()
+
+
+@pytest.mark.parametrize("path, error_code, name, expected_message", [
+    (path_correct, "EXPECT_COMMA", "x", "Found 'x', expected ','"),
+    (path_correct, "EXPECT_OPEN_CURLY_BRACKET", "x", "Found 'x', expected '{'"),
+    (path_correct, "WRONG_BLOCK_ORDER", "CLOCK", "'CLOCK' block order is wrong"),
+    (path_correct, "MISSING_MONITOR", None, "At least one monitor should be defined")
+])
+def test_get_error_message(new_parser, path, error_code, name, expected_message):
+    """Test if error messages are generated correctly."""
+    error_handler = new_parser.error_handler
+
+    assert error_handler.get_error_message(getattr(error_handler, error_code), name) == expected_message
+
+
+@pytest.mark.parametrize("path", [path_correct])
+def test_get_error_message_gives_errors(new_parser, path):
+    """Test if get_error_message raises expected exceptions."""
+    error_handler = new_parser.error_handler
+
+    with pytest.raises(ValueError):
+        error_handler.get_error_message(-1, "x")
+    with pytest.raises(TypeError):
+        error_handler.get_error_message(error_handler.MISSING_INPUT_TO_PIN)
+
+    # An empty name is shown, e.g. for errors at the end of the file
+    assert error_handler.get_error_message(error_handler.EXPECT_SEMICOLON, "") == "Found '', expected ';'"
+    assert error_handler.get_error_message(error_handler.MISSING_CLOCK_OR_SWITCH)
+
+
+@pytest.mark.parametrize("path", [path_all_error_1])
+def test_line_terminal_output(new_parser, path):
+    """Test if line terminal outputs are displayed correctly."""
+    new_parser.parse_network()
+    error_output = new_parser.fetch_error_output()[1]  # CTYPE at column 4 of line 4, truncated on the right
+    column = 4
+
+    assert error_output.line_location == "Line 4:"
+    assert error_output.line_with_issue == "D2: CTYPE; # EXPECT_INPUT_DEVI..."
+    assert error_output.arrow == "^".rjust(column + 1)
+    assert error_output.message == "Found 'CTYPE', expected 'AND', 'NAND', 'OR', 'NOR', 'XOR', 'DTYPE' or 'RC'"
+
+
+@pytest.mark.parametrize("path", [path_all_error_1])
+def test_line_terminal_output_repeated(new_parser, path):
+    """Test if line terminal outputs display the same text every time, matching the expected output."""
+    expected_output = [
+        "\nLine 3:\nDEVICE: DTYPE; # EXPECT_ID...\n^\nFound 'DEVICE', expected a non-keyword identifier\n",
+        ("\nLine 4:\nD2: CTYPE; # EXPECT_INPUT_DEVI...\n    ^\n"
+         "Found 'CTYPE', expected 'AND', 'NAND', 'OR', 'NOR', 'XOR', 'DTYPE' or 'RC'\n"),
+        ("\nLine 5:\nG0: D; # EXPECT_INPUT_DEVICE\n\n    ^\n"
+         "Found 'D', expected 'AND', 'NAND', 'OR', 'NOR', 'XOR', 'DTYPE' or 'RC'\n")
+    ]
+    new_parser.parse_network()
+    error_output = new_parser.fetch_error_output()
+
+    first_display = [str(error) for error in error_output]
+    second_display = [str(error) for error in error_output]
+
+    assert first_display == second_display
+    assert first_display[:len(expected_output)] == expected_output